@@ -4,46 +4,114 @@
 Usage examples:
   python scripts/build.py --target-platforms linux-64
   python scripts/build.py --recipe-path recipes/hatchet-cli/recipe.yaml --target-platforms linux-64 --no-upload
+  python scripts/build.py --target-platforms linux-64 osx-arm64 --jobs 4
+  python scripts/build.py --target-platforms linux-64 --batch
 
 The script uses rattler-build's --skip-existing option to avoid rebuilding packages
-that already exist in the target channel.
+that already exist in the target channel. Artifacts built locally are also recorded
+in output/build_cache.json, keyed by the generated recipe's content hash, so unchanged
+recipes skip rattler-build entirely (disable with --no-build-cache).
 """
 
 import argparse
+import contextlib
+import functools
+import hashlib
+import io
+import json
 import os
+import re
 import shlex
-import shutil
 import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, NamedTuple, Optional, TextIO, Tuple
 
 import yaml  # type: ignore
 
+# Prefer the libyaml-backed loader/dumper; fall back to the pure-Python ones.
+try:
+    from yaml import CSafeDumper as YamlDumper  # type: ignore
+    from yaml import CSafeLoader as YamlLoader  # type: ignore
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as YamlDumper  # type: ignore
+    from yaml import SafeLoader as YamlLoader  # type: ignore
+
 # Fix Windows encoding issue - ensure UTF-8 output
 if sys.platform == "win32":
-    import io
-
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8")
 
+GENERATED_RECIPE_HEADER = (
+    "# yaml-language-server: $schema=https://raw.githubusercontent.com/prefix-dev/recipe-format/main/schema.json\n"
+)
+GENERATED_RECIPE_DUMP_OPTIONS: Dict[str, Any] = {
+    "sort_keys": False,
+    "default_flow_style": False,
+    # Never re-wrap long scalars, so the output doesn't depend on line-wrap heuristics.
+    "width": 10_000,
+}
+# Bump when RenderedRecipe.data changes in a way the dump options don't capture, so
+# generated recipes and build cache entries from the old format are invalidated.
+GENERATED_RECIPE_FORMAT_VERSION = 1
+
+# Maps (generated recipe digest, target platform, rattler-build version) to the artifact
+# built from it, so unchanged recipes don't invoke rattler-build again.
+BUILD_CACHE_PATH = Path("output") / "build_cache.json"
+RECIPE_HASH_FILENAME = ".recipe.hash"
+
+# Serializes writes that are shared between parallel build jobs
+# (flushed job logs and the GitHub step summary).
+_OUTPUT_LOCK = threading.Lock()
+_BUILD_CACHE_LOCK = threading.Lock()
+
+
+# KEY=value lines of a .env file; values may be quoted and followed by a " # comment".
+_DOTENV_RE = re.compile(
+    rb"""^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(?:"([^"\n]*)"|'([^'\n]*)'|([^\n]*?))[ \t\r]*(?:[ \t]#[^\n]*)?$""",
+    re.MULTILINE,
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _parse_dotenv(path: Path, mtime_ns: int) -> Tuple[Tuple[str, str], ...]:
+    return tuple(
+        (m.group(1).decode(), (m.group(2) or m.group(3) or m.group(4) or b"").decode())
+        for m in _DOTENV_RE.finditer(path.read_bytes())
+    )
+
 
-def load_dotenv(path: Path):
-    if not path.exists():
+def load_dotenv(path: Path) -> Dict[str, str]:
+    """Parse a .env file; the result is cached until the file changes."""
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
         return {}
-    env = {}
-    for line in path.read_text().splitlines():
-        line = line.strip()
-        if not line or line.startswith("#"):
-            continue
-        if "=" in line:
-            k, v = line.split("=", 1)
-            env[k.strip()] = v.strip().strip('"').strip("'")
-    return env
-
-
-def run(cmd: List[str], env=None, cwd: Optional[Path] = None, check=True):
-    print("$ ", " ".join(shlex.quote(c) for c in cmd))
-    res = subprocess.run(cmd, env=env, cwd=cwd)
+    return dict(_parse_dotenv(path, mtime_ns))
+
+
+def run(cmd: List[str], env=None, cwd: Optional[Path] = None, check=True, out: Optional[TextIO] = None):
+    """Run a command, streaming its output to stdout.
+
+    When ``out`` is given, stdout/stderr of the command are captured and written to
+    ``out`` instead, so that parallel jobs don't interleave their logs.
+    """
+    print("$ ", " ".join(shlex.quote(c) for c in cmd), file=out)
+    if out is None:
+        res = subprocess.run(cmd, env=env, cwd=cwd)
+    else:
+        res = subprocess.run(
+            cmd,
+            env=env,
+            cwd=cwd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+        )
+        out.write(res.stdout)
     if check and res.returncode != 0:
         raise RuntimeError(f"Command failed: {' '.join(cmd)} (exit {res.returncode})")
     return res.returncode
@@ -57,18 +125,117 @@ def find_recipes(recipe_path: Optional[str]) -> List[Path]:
     """
     if recipe_path:
         return [Path(recipe_path)]
-    # Only match recipes/<recipe-name>/recipe.yaml, not generated subdirectories
-    recipes = list(Path("recipes").glob("*/recipe.yaml"))
+    # Only match recipes/<recipe-name>/recipe.yaml, not generated subdirectories.
+    # A single scandir pass never descends into recipe folders.
+    try:
+        with os.scandir("recipes") as it:
+            recipes = [
+                Path("recipes", entry.name, "recipe.yaml")
+                for entry in it
+                if entry.is_dir(follow_symlinks=False) and os.path.isfile(os.path.join(entry.path, "recipe.yaml"))
+            ]
+    except FileNotFoundError:
+        return []
     return sorted(recipes)
 
 
-def package_exists_locally(target_platform: str, name: str, version: str) -> bool:
+class RenderedRecipe:
+    """A parsed recipe and the generated recipe.yaml rendered from it.
+
+    ``digest`` is derived from the source bytes and the dump settings, so an unchanged
+    recipe can be recognised without dumping it; ``data`` is only rendered on first use.
+    """
+
+    def __init__(self, content: Dict[str, Any], digest: str):
+        self.content = content
+        self.digest = digest
+
+    @functools.cached_property
+    def data(self) -> bytes:
+        return GENERATED_RECIPE_HEADER.encode() + yaml.dump(
+            self.content, Dumper=YamlDumper, encoding="utf-8", **GENERATED_RECIPE_DUMP_OPTIONS
+        )
+
+
+def content_digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=32).hexdigest()
+
+
+def render_recipe(recipe_yaml_path: Path) -> RenderedRecipe:
+    """Parse a recipe once; the result is shared by all platforms."""
+    raw = recipe_yaml_path.read_bytes()
+    # Hand raw bytes to the loader so libyaml does the decoding.
+    recipe_content = yaml.load(raw, Loader=YamlLoader)
+    # Salt with everything besides the source that shapes the generated output: the emitter
+    # (a PyYAML upgrade may change it), the dump options and the render format.
+    salt = (
+        f"{GENERATED_RECIPE_FORMAT_VERSION}:{yaml.__version__}:{YamlDumper.__name__}:"
+        f"{json.dumps(GENERATED_RECIPE_DUMP_OPTIONS, sort_keys=True)}\n"
+    ).encode() + GENERATED_RECIPE_HEADER.encode()
+    return RenderedRecipe(recipe_content, content_digest(salt + raw))
+
+
+def read_recipe_hash(generated_recipe_dir: Path) -> Optional[str]:
+    """Return the digest recorded for the generated recipe, if it is still present."""
+    if not (generated_recipe_dir / "recipe.yaml").exists():
+        return None
+    try:
+        return (generated_recipe_dir / RECIPE_HASH_FILENAME).read_text().strip()
+    except FileNotFoundError:
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def rattler_build_version() -> str:
+    try:
+        res = subprocess.run(["rattler-build", "--version"], capture_output=True, text=True)
+    except OSError:
+        return "unknown"
+    return res.stdout.strip() or "unknown"
+
+
+def build_cache_key(digest: str, target_platform: str) -> str:
+    return f"{digest}:{target_platform}:{rattler_build_version()}"
+
+
+def _load_build_cache() -> Dict[str, str]:
+    try:
+        return json.loads(BUILD_CACHE_PATH.read_text())
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def lookup_build_cache(key: str) -> Optional[Path]:
+    """Return the artifact previously built for ``key`` if it still exists on disk."""
+    with _BUILD_CACHE_LOCK:
+        artifact = _load_build_cache().get(key)
+    if artifact and Path(artifact).is_file():
+        return Path(artifact)
+    return None
+
+
+def record_build_cache(key: str, artifact: Path):
+    with _BUILD_CACHE_LOCK:
+        cache = _load_build_cache()
+        cache[key] = str(artifact)
+        BUILD_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp = BUILD_CACHE_PATH.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(cache, indent=2, sort_keys=True))
+        os.replace(tmp, BUILD_CACHE_PATH)
+
+
+def package_exists_locally(target_platform: str, name: str, version: str, out: Optional[TextIO] = None) -> bool:
     """Check if package file already exists locally in output directory."""
-    pattern = f"output/{target_platform}/{name}-{version}-*_*.conda"
-    files = list(Path(".").glob(pattern))
-    if files:
-        print(f"✓ {files[0].name} already built locally")
-        return True
+    prefix = f"{name}-{version}-"
+    try:
+        with os.scandir(Path("output") / target_platform) as it:
+            for entry in it:
+                # Same match as the <name>-<version>-*_*.conda glob, stopping at the first hit.
+                if entry.name.startswith(prefix) and entry.name.endswith(".conda") and "_" in entry.name[len(prefix):]:
+                    print(f"✓ {entry.name} already built locally", file=out)
+                    return True
+    except FileNotFoundError:
+        pass
     return False
 
 
@@ -83,121 +250,260 @@ def find_local_artifacts(target_platform: str, name: str, version: str) -> List[
     return files
 
 
-def build_recipe(
+class BuildJob(NamedTuple):
+    """A recipe prepared for one target platform, ready to be built and/or uploaded."""
+
+    recipe_name: str
+    package_name: str
+    version: str
+    # Platform directory the artifact ends up in ("noarch" for noarch recipes).
+    artifact_platform: str
+    recipe_yaml_out: Path
+    cache_key: str
+    needs_build: bool
+    # Artifact already known to match this job (a build cache hit), if any.
+    artifact: Optional[Path] = None
+
+
+@contextlib.contextmanager
+def log_group(name: str, error_title: str, out: Optional[TextIO] = None):
+    """Wrap output in a GitHub Actions log group and annotate failures."""
+    print(f"::group::{name}", file=out)
+    try:
+        yield
+    except Exception as e:
+        print(f"::error title={error_title}::recipe failed to cook", file=out)
+        print(e, file=out)
+        raise
+    finally:
+        print("::endgroup::", file=out)
+
+
+def write_generated_recipe(
+    recipe_dir: Path, target_platform: str, rendered: RenderedRecipe, out: Optional[TextIO] = None
+) -> Path:
+    generated_recipe_dir = recipe_dir / f"generated/{target_platform}"
+    recipe_yaml_out = generated_recipe_dir / "recipe.yaml"
+    if read_recipe_hash(generated_recipe_dir) == rendered.digest:
+        print(f"Unchanged {recipe_yaml_out}", file=out)
+    else:
+        # Overwrite in place; the directory only ever holds the recipe and its hash.
+        generated_recipe_dir.mkdir(parents=True, exist_ok=True)
+        recipe_yaml_out.write_bytes(rendered.data)
+        (generated_recipe_dir / RECIPE_HASH_FILENAME).write_text(rendered.digest)
+        print(f"Written {recipe_yaml_out}", file=out)
+    return recipe_yaml_out
+
+
+def prepare_build(
     recipe_yaml_path: Path,
+    rendered: RenderedRecipe,
     target_platform: str,
-    channel: str,
     upload_flag: bool,
     build_flag: bool,
     skip_existing: bool,
-):
+    use_build_cache: bool,
+    out: Optional[TextIO] = None,
+) -> Optional[BuildJob]:
+    """Write the generated recipe and decide whether rattler-build needs to run.
+
+    Returns None when there is nothing left to do for this recipe/platform.
+    """
     recipe_dir = recipe_yaml_path.parent
     recipe_name = recipe_dir.name
-    print(f"::group::{recipe_name}-{target_platform}")
+    recipe_content = rendered.content
+    version = str(recipe_content.get("context", {}).get("version"))
+    package_name = str(recipe_content.get("package", {}).get("name") or recipe_name)
+
+    # Check if recipe is noarch - only build on linux-64 to avoid duplicate builds
+    build_config = recipe_content.get("build", {})
+    is_noarch = build_config.get("noarch") is not None
+    if is_noarch and target_platform != "linux-64":
+        print(f"ℹ️  Skipping noarch package on {target_platform} (will be built on linux-64)", file=out)
+        return None
+
+    recipe_yaml_out = write_generated_recipe(recipe_dir, target_platform, rendered, out)
+    # For noarch packages, the artifact lives in output/noarch/.
+    artifact_platform = "noarch" if is_noarch else target_platform
+    cache_key = build_cache_key(rendered.digest, target_platform)
+
+    needs_build = build_flag
+    cached_artifact = None
+    if build_flag:
+        # Check local cache first before invoking rattler-build.
+        cached_artifact = lookup_build_cache(cache_key) if use_build_cache else None
+        if cached_artifact:
+            print(f"✓ {cached_artifact.name} already built from identical inputs; skipping build", file=out)
+            needs_build = False
+            if not upload_flag:
+                return None
+        elif skip_existing and package_exists_locally(artifact_platform, package_name, version, out):
+            print(f"✓ {package_name} {version} already exists locally; skipping build", file=out)
+            # Important: if upload is enabled, still attempt upload of existing artifact.
+            # This fixes the case where build happened previously but upload was skipped/failed.
+            if not upload_flag:
+                return None
+
+    return BuildJob(
+        recipe_name, package_name, version, artifact_platform, recipe_yaml_out, cache_key, needs_build, cached_artifact
+    )
+
+
+def rattler_build_command(
+    recipe_paths: List[Path], target_platform: str, channel: str, skip_existing: bool
+) -> List[str]:
+    # Build the channel URL for prefix.dev
+    channel_url = f"https://repo.prefix.dev/{channel}"
+
+    # Run rattler-build with --skip-existing all to check remote channel
+    # Add the target channel for remote existence check
+    cmd = ["rattler-build", "build"]
+    for recipe_path in recipe_paths:
+        cmd += ["-r", str(recipe_path)]
+    cmd += [
+        "--target-platform",
+        target_platform,
+        "--test",
+        "native",
+        "-c",
+        channel_url,  # Add target channel first for skip-existing check
+        "-c",
+        "conda-forge",
+        "--skip-existing",
+        "all" if skip_existing else "none",
+    ]
+    return cmd
+
+
+def snapshot_artifacts(platform: str) -> Dict[str, int]:
+    """Map the .conda file names in output/<platform> to their mtime (ns)."""
     try:
-        recipe_content = yaml.safe_load(recipe_yaml_path.read_text())
-        version = str(recipe_content.get("context", {}).get("version"))
-        package_name = str(recipe_content.get("package", {}).get("name") or recipe_name)
-        
-        # Check if recipe is noarch - only build on linux-64 to avoid duplicate builds
-        build_config = recipe_content.get("build", {})
-        is_noarch = build_config.get("noarch") is not None
-        if is_noarch and target_platform != "linux-64":
-            print(f"ℹ️  Skipping noarch package on {target_platform} (will be built on linux-64)")
-            print("::endgroup::")
+        with os.scandir(Path("output") / platform) as it:
+            return {entry.name: entry.stat().st_mtime_ns for entry in it if entry.name.endswith(".conda")}
+    except FileNotFoundError:
+        return {}
+
+
+def record_built_artifact(job: BuildJob, before: Dict[str, int]) -> Optional[Path]:
+    """Find the artifact rattler-build just wrote for ``job`` and record it in the build cache.
+
+    ``before`` is the snapshot of the output directory taken before the build, so only new or
+    rewritten files are considered. Returns None if nothing was written (e.g. the package was
+    skipped because it already exists in the channel).
+    """
+    prefix = f"{job.package_name}-{job.version}-"
+    after = snapshot_artifacts(job.artifact_platform)
+    changed = [(mtime, name) for name, mtime in after.items() if name.startswith(prefix) and before.get(name) != mtime]
+    if not changed:
+        return None
+    artifact = Path("output", job.artifact_platform, max(changed)[1])
+    record_build_cache(job.cache_key, artifact)
+    return artifact
+
+
+def upload_artifact(job: BuildJob, channel: str, out: Optional[TextIO] = None, artifact_path: Optional[Path] = None):
+    prefix_token = os.environ.get("PREFIX_API_KEY") or os.environ.get("PREFIX_TOKEN")
+    if not prefix_token:
+        print("⚠️  PREFIX_API_KEY/PREFIX_TOKEN not found in environment; skipping upload", file=out)
+        return
+
+    if artifact_path is None:
+        # Find artifact - match any build number.
+        # For noarch packages, look in output/noarch/ instead of output/{target_platform}/.
+        files = find_local_artifacts(job.artifact_platform, job.package_name, job.version)
+        if not files:
+            # Package might have been skipped due to --skip-existing all (remote already has it),
+            # or build was disabled.
+            print(f"✓ No local artifacts to upload (package may already exist in {channel})", file=out)
             return
-        
-        generated_recipe_dir = recipe_dir / f"generated/{target_platform}"
-        # clear dir
-        if generated_recipe_dir.exists():
-            shutil.rmtree(generated_recipe_dir)
-        generated_recipe_dir.mkdir(parents=True, exist_ok=True)
+        artifact_path = files[0]
 
-        recipe_yaml_out = generated_recipe_dir / "recipe.yaml"
-        # write with schema header
-        header = "# yaml-language-server: $schema=https://raw.githubusercontent.com/prefix-dev/recipe-format/main/schema.json\n"
-        out_text = header + yaml.safe_dump(recipe_content, sort_keys=False)
-        recipe_yaml_out.write_text(out_text)
-        print(f"Written {recipe_yaml_out}")
-
-        if build_flag:
-            # Check local cache first before invoking rattler-build.
-            # For noarch packages, the artifact lives in output/noarch/.
-            local_platform = "noarch" if is_noarch else target_platform
-            local_files = find_local_artifacts(local_platform, package_name, version)
-            if skip_existing and local_files:
-                print(f"✓ {local_files[0].name} already built locally")
-                print(f"✓ {package_name} {version} already exists locally; skipping build")
-                # Important: if upload is enabled, still attempt upload of existing artifact.
-                # This fixes the case where build happened previously but upload was skipped/failed.
-                if not upload_flag:
-                    print("::endgroup::")
-                    return
-
-            # Build the channel URL for prefix.dev
-            channel_url = f"https://repo.prefix.dev/{channel}"
-
-            # Run rattler-build with --skip-existing all to check remote channel
-            # Add the target channel for remote existence check
-            cmd = [
-                "rattler-build",
-                "build",
-                "-r",
-                str(recipe_yaml_out),
-                "--target-platform",
-                target_platform,
-                "--test",
-                "native",
-                "-c",
-                channel_url,  # Add target channel first for skip-existing check
-                "-c",
-                "conda-forge",
-                "--skip-existing",
-                "all" if skip_existing else "none",
-            ]
-            run(cmd)
-            print(f"✓ Built for {target_platform}")
+    artifact = str(artifact_path)
+
+    env = os.environ.copy()
+    env["PREFIX_API_KEY"] = prefix_token
+
+    print(f"✓ API key found: {prefix_token[:5]}...", file=out)
+
+    upload_cmd = ["rattler-build", "upload", "prefix", "-c", channel, "--skip-existing", artifact]
+    run(upload_cmd, env=env, out=out)
+    print(f"✓ Uploaded {Path(artifact).name}", file=out)
+
+    gha_summary = os.environ.get("GITHUB_STEP_SUMMARY")
+    if gha_summary:
+        with _OUTPUT_LOCK, open(gha_summary, "a") as f:
+            f.write(f"- :rocket: `{job.artifact_platform}/{Path(artifact).name}`: **published**\n")
+
+
+def build_recipe(
+    recipe_yaml_path: Path,
+    rendered: RenderedRecipe,
+    target_platform: str,
+    channel: str,
+    upload_flag: bool,
+    build_flag: bool,
+    skip_existing: bool,
+    use_build_cache: bool = True,
+    out: Optional[TextIO] = None,
+):
+    recipe_name = recipe_yaml_path.parent.name
+    with log_group(f"{recipe_name}-{target_platform}", str(recipe_yaml_path), out):
+        job = prepare_build(
+            recipe_yaml_path, rendered, target_platform, upload_flag, build_flag, skip_existing, use_build_cache, out
+        )
+        if job is None:
+            return
+
+        artifact = job.artifact
+        if job.needs_build:
+            before = snapshot_artifacts(job.artifact_platform)
+            run(rattler_build_command([job.recipe_yaml_out], target_platform, channel, skip_existing), out=out)
+            print(f"✓ Built for {target_platform}", file=out)
+            artifact = record_built_artifact(job, before)
 
         if upload_flag:
-            prefix_token = os.environ.get("PREFIX_API_KEY") or os.environ.get("PREFIX_TOKEN")
-            if not prefix_token:
-                print("⚠️  PREFIX_API_KEY/PREFIX_TOKEN not found in environment; skipping upload")
-                print("::endgroup::")
-                return
-
-            # Find artifact - match any build number.
-            # For noarch packages, look in output/noarch/ instead of output/{target_platform}/.
-            search_platform = "noarch" if is_noarch else target_platform
-            files = find_local_artifacts(search_platform, package_name, version)
-            if not files:
-                # Package might have been skipped due to --skip-existing all (remote already has it),
-                # or build was disabled.
-                print(f"✓ No local artifacts to upload (package may already exist in {channel})")
-                print("::endgroup::")
-                return
-
-            artifact = str(files[0])
-
-            env = os.environ.copy()
-            env["PREFIX_API_KEY"] = prefix_token
-
-            print(f"✓ API key found: {prefix_token[:5]}...")
-
-            upload_cmd = ["rattler-build", "upload", "prefix", "-c", channel, "--skip-existing", artifact]
-            run(upload_cmd, env=env)
-            print(f"✓ Uploaded {Path(artifact).name}")
-
-            gha_summary = os.environ.get("GITHUB_STEP_SUMMARY")
-            if gha_summary:
-                with open(gha_summary, "a") as f:
-                    f.write(f"- :rocket: `{search_platform}/{Path(artifact).name}`: **published**\n")
+            upload_artifact(job, channel, out, artifact)
 
-    except Exception as e:
-        print(f"::error title={recipe_yaml_path}::recipe failed to cook")
-        print(e)
-        print("::endgroup::")
-        raise
-    print("::endgroup::")
+
+def build_recipes_batch(
+    recipes: List[Path],
+    rendered: Dict[Path, RenderedRecipe],
+    target_platform: str,
+    channel: str,
+    upload_flag: bool,
+    build_flag: bool,
+    skip_existing: bool,
+    use_build_cache: bool = True,
+):
+    """Build all recipes for one platform with a single rattler-build invocation.
+
+    rattler-build loads the channel index once and builds the recipes in dependency
+    order; uploads still happen per recipe afterwards.
+    """
+    jobs: List[BuildJob] = []
+    for recipe in recipes:
+        with log_group(f"{recipe.parent.name}-{target_platform}", str(recipe)):
+            job = prepare_build(
+                recipe, rendered[recipe], target_platform, upload_flag, build_flag, skip_existing, use_build_cache
+            )
+        if job is not None:
+            jobs.append(job)
+
+    artifacts: Dict[str, Optional[Path]] = {}
+    pending = [job for job in jobs if job.needs_build]
+    if pending:
+        with log_group(f"batch-{target_platform}", f"batch-{target_platform}"):
+            before = {p: snapshot_artifacts(p) for p in {job.artifact_platform for job in pending}}
+            recipe_paths = [job.recipe_yaml_out for job in pending]
+            run(rattler_build_command(recipe_paths, target_platform, channel, skip_existing))
+            print(f"✓ Built {len(pending)} recipe(s) for {target_platform}")
+            for job in pending:
+                artifacts[job.recipe_name] = record_built_artifact(job, before[job.artifact_platform])
+
+    if upload_flag:
+        for job in jobs:
+            with log_group(f"upload-{job.recipe_name}-{target_platform}", str(job.recipe_yaml_out)):
+                upload_artifact(job, channel, artifact_path=artifacts.get(job.recipe_name, job.artifact))
 
 
 def main():
@@ -213,25 +519,117 @@ def main():
         default=os.environ.get("SKIP_EXISTING", "0") == "1",
         help="Skip build if package version already exists on prefix.dev",
     )
+    parser.add_argument(
+        "--no-build-cache",
+        dest="no_build_cache",
+        action="store_true",
+        help="Always invoke rattler-build, even if an artifact was built from identical inputs before",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=os.environ.get("RATTLER_CACHE_DIR"),
+        help="Package/repodata cache shared by all rattler-build invocations (default: rattler's own cache dir)",
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Build all recipes of a platform with one rattler-build invocation (ignores --jobs)",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        # Parallel rattler-build processes share output/, which each one re-indexes and uses
+        # as its test channel, so parallelism is opt-in.
+        default=1,
+        help="Number of recipe/platform builds to run in parallel (default: 1)",
+    )
     args = parser.parse_args()
 
     # load .env if present
     env_vars = load_dotenv(Path(".env"))
     os.environ.update(env_vars)
 
+    # Point every rattler-build process (including parallel jobs) at the same cache, so the
+    # channel index and packages are fetched once and reused by the others.
+    if args.cache_dir:
+        os.environ["RATTLER_CACHE_DIR"] = str(Path(args.cache_dir).expanduser().resolve())
+
     platforms = args.target_platforms or (["linux-64"])
 
     recipes = find_recipes(args.recipe_path)
+    # Parse and render every recipe once up front; the result is shared by all platforms.
+    rendered = {}
     for recipe in recipes:
+        try:
+            rendered[recipe] = render_recipe(recipe)
+        except Exception:
+            print(f"::error title={recipe}::failed to parse recipe")
+            raise
+    if args.batch:
         for target in platforms:
+            build_recipes_batch(
+                recipes,
+                rendered,
+                target,
+                args.channel,
+                not args.no_upload,
+                not args.no_build,
+                args.skip_existing,
+                not args.no_build_cache,
+            )
+        return
+
+    tasks = [(recipe, target) for recipe in recipes for target in platforms]
+    jobs = max(1, min(args.jobs or 1, len(tasks) or 1))
+
+    if jobs == 1:
+        for recipe, target in tasks:
+            build_recipe(
+                recipe,
+                rendered[recipe],
+                target,
+                args.channel,
+                not args.no_upload,
+                not args.no_build,
+                args.skip_existing,
+                not args.no_build_cache,
+            )
+        return
+
+    def build_buffered(recipe: Path, target: str) -> Tuple[str, Optional[Exception]]:
+        buf = io.StringIO()
+        try:
             build_recipe(
                 recipe,
+                rendered[recipe],
                 target,
                 args.channel,
                 not args.no_upload,
                 not args.no_build,
                 args.skip_existing,
+                not args.no_build_cache,
+                out=buf,
             )
+        except Exception as e:
+            return buf.getvalue(), e
+        return buf.getvalue(), None
+
+    # Each job buffers its log and flushes it in one piece once finished, so the
+    # ::group:: sections stay readable in CI.
+    failures: List[Exception] = []
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(build_buffered, recipe, target) for recipe, target in tasks]
+        for fut in as_completed(futures):
+            log, error = fut.result()
+            with _OUTPUT_LOCK:
+                sys.stdout.write(log)
+                sys.stdout.flush()
+            if error is not None:
+                failures.append(error)
+
+    if failures:
+        raise failures[0]
 
 
 if __name__ == "__main__":
@@ -4,24 +4,89 @@
 Usage: python scripts/update.py --recipe recipes/hatchet-cli/recipe.yaml --owner hatchet-dev --repo hatchet [--apply]
 """
 import argparse
+import asyncio
+import contextlib
+import copy
+import functools
 import hashlib
+import json
+import logging
 import os
 import re
 import sys
-from typing import Any, Dict, List, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from urllib.parse import unquote, urlparse
 
 import httpx
 import yaml  # type: ignore
 
+# Prefer the libyaml-backed loader/dumper; fall back to the pure-Python ones.
+try:
+    from yaml import CSafeDumper as YamlDumper  # type: ignore
+    from yaml import CSafeLoader as YamlLoader  # type: ignore
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as YamlDumper  # type: ignore
+    from yaml import SafeLoader as YamlLoader  # type: ignore
+
+try:  # HTTP/2 needs the optional h2 package (httpx[http2])
+    import h2  # type: ignore  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 # Fix Windows encoding issue - ensure UTF-8 output
 if sys.platform == "win32":
     import io
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8")
 
 
+log = logging.getLogger("update")
+
+
+class RecipeLog(logging.LoggerAdapter):
+    """Prefixes messages with the recipe name, so concurrent updates stay readable."""
+
+    def process(self, msg: Any, kwargs: Any) -> Tuple[Any, Any]:
+        return f"[{self.extra['recipe']}] {msg}", kwargs
+
+
 # Network defaults: keep CI runs from hanging indefinitely.
 DEFAULT_HTTP_TIMEOUT = 30.0
 ASSET_DOWNLOAD_TIMEOUT = 120.0
+HASH_CHUNK_SIZE = 1 << 20
+
+# hashlib releases the GIL on large buffers, so hashing downloads on worker threads keeps
+# the event loop free for other recipes' requests.
+HASH_POOL = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1), thread_name_prefix="sha256")
+
+# Conditional-request metadata and other cached lookups persist here between runs.
+CACHE_DIR = os.environ.get("UPDATE_CACHE_DIR") or os.path.join(".cache", "update-py")
+CHECKSUM_CACHE_DIR = os.path.join(CACHE_DIR, "checksums")
+
+# Recipes are updated concurrently; keep the fan-out modest to respect GitHub's
+# secondary rate limits.
+MAX_CONCURRENT_RECIPES = 8
+MAX_REQUESTS_PER_HOST = 8
+
+# Rate-limited (429, or 403 with rate-limit headers) requests are retried with exponential
+# backoff, honouring Retry-After / X-RateLimit-Reset. Waits longer than the cap fail fast.
+RATE_LIMIT_RETRIES = 3
+RATE_LIMIT_BACKOFF = 1.0
+MAX_RATE_LIMIT_WAIT = 60.0
+# Hold a host back until its quota resets once fewer requests than this remain, so the
+# requests already in flight don't run into the limit.
+RATE_LIMIT_RESERVE = MAX_REQUESTS_PER_HOST
+
+# Suffixes of per-asset checksum files ("sidecars"), e.g. foo.tar.gz.sha256
+CHECKSUM_SUFFIXES = (".sha256", ".sha256sum", ".sha256.txt", ".sha256sums")
+
+# Release-wide checksum listings worth fetching before they are needed: SHA256SUMS,
+# checksums.txt, tool_1.2.3_checksums.txt, ... Only listings up to the size cap qualify.
+CHECKSUM_LISTING_PATTERN = re.compile(r"(?:^|[._-])(?:sha256sums?|checksums?)(?:\.txt)?$", re.IGNORECASE)
+MAX_PREFETCH_LISTING_SIZE = 1 << 20
 
 # Safe release asset basenames start and end with an alphanumeric, underscore, hyphen,
 # or plus sign, and may contain non-consecutive dots between those characters.
@@ -29,6 +94,34 @@ VALID_ASSET_BASENAME_PATTERN = re.compile(
     r"^(?:[A-Za-z0-9](?:[A-Za-z0-9_+-]|\.(?=[A-Za-z0-9_+-]))*[A-Za-z0-9_+-]|[A-Za-z0-9])$"
 )
 
+# owner/repo from git@github.com:owner/repo(.git) or https://github.com/owner/repo(.git)(/...)
+GITHUB_REPO_URL_PATTERN = re.compile(
+    r"(?:git@github\.com:|https?://github\.com/)(?P<owner>[^/]+)/(?P<repo>[^/]+?)(?:\.git)?(?:/|$)"
+)
+
+# One `<sha256 hex>  [*][./]<filename>` line of a sha256sum-style listing
+_CHECKSUM_LINE_RE = re.compile(r"^[ \t]*([0-9A-Fa-f]{64})[ \t]+\*?(?:\./)?([^\r\n]*?)[ \t]*\r?$", re.M)
+
+# Value of a `sha256:` mapping line (possibly the first key of a sequence item)
+_SHA256_LINE_RE = re.compile(r"^[ \t]*(?:-[ \t]+)?sha256:[ \t]*(\S+?)[ \t]*$", re.M)
+
+# GitHub asset digests look like "sha256:<hex>"
+_SHA256_DIGEST_RE = re.compile(r"sha-?256:?(.*)", re.IGNORECASE)
+
+# Last path segment of a URL
+_BASENAME_RE = re.compile(r"/([^/]+)$")
+
+# First line of every recipe file, pointing editors at the recipe schema.
+_YAML_HEADER = "# yaml-language-server: $schema=https://raw.githubusercontent.com/prefix-dev/recipe-format/main/schema.json\n"
+
+# Top-level `context.version` / `about.repository` scalars, read without a YAML parse.
+# Recipes are written by the safe dumper, so mapping children sit at a two-space indent.
+_CONTEXT_VERSION_RE = re.compile(r"^context:[ \t]*\n(?:[ \t]+.*\n|\n)*?  version:[ \t]*(.*?)[ \t]*$", re.M)
+_ABOUT_REPOSITORY_RE = re.compile(r"^about:[ \t]*\n(?:[ \t]+.*\n|\n)*?  repository:[ \t]*(.*?)[ \t]*$", re.M)
+
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+GRAPHQL_BATCH_SIZE = 50
+
 # GCS bucket for claude-code native binaries
 CLAUDE_CODE_GCS_BUCKET = "https://storage.googleapis.com/claude-code-dist-86c565f3-f756-42ad-8dfa-d59b1c096819/claude-code-releases"
 
@@ -43,7 +136,238 @@ def parse_args():
     return p.parse_args()
 
 
-def get_latest_release(owner: str, repo: str, token: Optional[str]) -> Dict[str, Any]:
+class HostLimiter:
+    """Caps concurrent requests per host and pauses a host while it is rate limited."""
+
+    def __init__(self, per_host: int = MAX_REQUESTS_PER_HOST):
+        self.per_host = per_host
+        self._slots: Dict[str, asyncio.Semaphore] = {}
+        self._open: Dict[str, asyncio.Event] = {}
+        self._resume_at: Dict[str, float] = {}
+
+    def _event(self, host: str) -> asyncio.Event:
+        event = self._open.get(host)
+        if event is None:
+            event = self._open[host] = asyncio.Event()
+            event.set()
+        return event
+
+    @contextlib.asynccontextmanager
+    async def __call__(self, host: str) -> AsyncIterator[None]:
+        slot = self._slots.get(host)
+        if slot is None:
+            slot = self._slots[host] = asyncio.Semaphore(self.per_host)
+        async with slot:
+            await self._event(host).wait()
+            yield
+
+    def pause(self, host: str, delay: float) -> None:
+        """Hold back new requests to ``host`` for ``delay`` seconds (extending any current pause)."""
+        loop = asyncio.get_running_loop()
+        resume_at = loop.time() + delay
+        if resume_at <= self._resume_at.get(host, 0.0):
+            return
+        self._resume_at[host] = resume_at
+        self._event(host).clear()
+        loop.call_later(delay, self._resume, host, resume_at)
+
+    def _resume(self, host: str, resume_at: float) -> None:
+        # Only the latest pause reopens the host.
+        if self._resume_at.get(host) == resume_at:
+            self._event(host).set()
+
+    def observe(self, host: str, r: httpx.Response) -> None:
+        """Pause ``host`` when a response says its rate-limit budget is used up."""
+        delay = rate_limit_delay(r)
+        if delay is not None and delay <= MAX_RATE_LIMIT_WAIT:
+            self.pause(host, delay)
+
+
+HOST_LIMITER = HostLimiter()
+
+
+def rate_limit_delay(r: httpx.Response) -> Optional[float]:
+    """Seconds to wait before the next request according to the rate-limit headers, if any.
+
+    That is Retry-After when given, else the time until X-RateLimit-Reset once the
+    remaining quota drops below RATE_LIMIT_RESERVE.
+    """
+    retry_after = r.headers.get("Retry-After")
+    if retry_after:
+        try:
+            return max(float(retry_after), 0.0)
+        except ValueError:
+            pass  # HTTP-date form; fall back to backoff
+    remaining = r.headers.get("X-RateLimit-Remaining", "")
+    if remaining.isdigit() and int(remaining) < RATE_LIMIT_RESERVE:
+        try:
+            return max(float(r.headers["X-RateLimit-Reset"]) - time.time(), 0.0) + 1.0
+        except (KeyError, ValueError):
+            return None
+    return None
+
+
+def is_rate_limited(r: httpx.Response) -> bool:
+    if r.status_code == 429:
+        return True
+    return r.status_code == 403 and (
+        "Retry-After" in r.headers or r.headers.get("X-RateLimit-Remaining") == "0"
+    )
+
+
+def _retry_delay(r: httpx.Response, attempt: int) -> Optional[float]:
+    """Backoff before retrying a rate-limited response, or None to give up on it."""
+    if not is_rate_limited(r) or attempt >= RATE_LIMIT_RETRIES:
+        return None
+    delay = rate_limit_delay(r)
+    if delay is None:
+        delay = RATE_LIMIT_BACKOFF * 2 ** attempt
+    if delay > MAX_RATE_LIMIT_WAIT:
+        log.warning("Rate limited by %s for %.0fs; not waiting", r.url.host, delay)
+        return None
+    return delay
+
+
+async def limited_request(client: httpx.AsyncClient, method: str, url: str, **kwargs: Any) -> httpx.Response:
+    """``client.request`` under the per-host limiter, retrying rate-limited responses."""
+    host = httpx.URL(url).host
+    attempt = 0
+    while True:
+        async with HOST_LIMITER(host):
+            r = await client.request(method, url, **kwargs)
+        HOST_LIMITER.observe(host, r)
+        delay = _retry_delay(r, attempt)
+        if delay is None:
+            return r
+        HOST_LIMITER.pause(host, delay)
+        attempt += 1
+
+
+async def limited_get(client: httpx.AsyncClient, url: str, **kwargs: Any) -> httpx.Response:
+    return await limited_request(client, "GET", url, **kwargs)
+
+
+@contextlib.asynccontextmanager
+async def limited_stream(
+    client: httpx.AsyncClient, method: str, url: str, **kwargs: Any
+) -> AsyncIterator[httpx.Response]:
+    """``client.stream`` under the per-host limiter, retrying rate-limited responses."""
+    host = httpx.URL(url).host
+    attempt = 0
+    while True:
+        async with HOST_LIMITER(host):
+            async with client.stream(method, url, **kwargs) as r:
+                HOST_LIMITER.observe(host, r)
+                delay = _retry_delay(r, attempt)
+                if delay is None:
+                    yield r
+                    return
+        HOST_LIMITER.pause(host, delay)
+        attempt += 1
+
+
+class JsonCache:
+    """A small on-disk JSON cache (one file under CACHE_DIR), written through atomically."""
+
+    def __init__(self, name: str):
+        self.path = os.path.join(CACHE_DIR, name)
+        self._data: Optional[Dict[str, Any]] = None
+
+    def _load(self) -> Dict[str, Any]:
+        if self._data is None:
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self._data = json.load(f)
+            except (OSError, ValueError):
+                self._data = {}
+        return self._data
+
+    def get(self, key: str) -> Optional[Any]:
+        return self._load().get(key)
+
+    def set(self, key: str, value: Any) -> None:
+        data = self._load()
+        # Copy so later in-place changes by callers don't leak into the cache.
+        data[key] = copy.deepcopy(value)
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            tmp = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            log.warning("Could not write cache %s: %s", self.path, e)
+
+
+RELEASES_CACHE = JsonCache("releases.json")
+GCS_MANIFESTS_CACHE = JsonCache("gcs_manifests.json")
+ASSET_SHA_CACHE = JsonCache("asset_sha.json")
+
+# In-flight/finished release lookups of this run, so recipes sharing a repo fetch it once.
+_release_requests: Dict[Tuple[str, str], "asyncio.Future[Dict[str, Any]]"] = {}
+
+# Latest release tags prefetched for all recipes in one GraphQL query (see prefetch_latest_tags).
+_latest_tags: Dict[Tuple[str, str], str] = {}
+
+
+async def prefetch_latest_tags(client: httpx.AsyncClient, targets: List[Tuple[str, str]], token: str) -> None:
+    """Look up the latest release tag of many repos with batched GraphQL queries.
+
+    Recipes whose version already matches the prefetched tag are skipped without a REST
+    call; recipes that need updating still fetch their release (with assets and digests)
+    over REST. GraphQL needs a token, and any failure just leaves the REST path to do
+    the work.
+    """
+    targets = sorted(set(targets))
+    headers = {"Authorization": f"bearer {token}"}
+    for start in range(0, len(targets), GRAPHQL_BATCH_SIZE):
+        batch = targets[start : start + GRAPHQL_BATCH_SIZE]
+        fields = " ".join(
+            f"r{i}: repository(owner: {json.dumps(o)}, name: {json.dumps(n)}) {{ latestRelease {{ tagName }} }}"
+            for i, (o, n) in enumerate(batch)
+        )
+        try:
+            r = await limited_request(
+                client, "POST", GITHUB_GRAPHQL_URL, json={"query": f"query {{ {fields} }}"},
+                headers=headers, timeout=DEFAULT_HTTP_TIMEOUT,
+            )
+            r.raise_for_status()
+            data = r.json().get("data") or {}
+        except (httpx.HTTPError, ValueError) as e:
+            log.warning("GraphQL release prefetch failed, falling back to REST: %s", e)
+            return
+        for i, key in enumerate(batch):
+            release = (data.get(f"r{i}") or {}).get("latestRelease") or {}
+            if release.get("tagName"):
+                _latest_tags[key] = release["tagName"]
+
+
+async def peek_latest_tag(client: httpx.AsyncClient, owner: str, repo: str) -> Optional[str]:
+    """Read the latest release tag off the github.com `/releases/latest` redirect.
+
+    A HEAD request carries no body and isn't counted against the API rate limit; the
+    tag is the last segment of the `Location` (".../releases/tag/<tag>").
+    """
+    url = f"https://github.com/{owner}/{repo}/releases/latest"
+    try:
+        r = await limited_request(client, "HEAD", url, follow_redirects=False, timeout=DEFAULT_HTTP_TIMEOUT)
+    except httpx.HTTPError as e:
+        log.debug("HEAD %s failed: %s", url, e)
+        return None
+    location = r.headers.get("Location", "")
+    if "/releases/tag/" not in location:
+        return None
+    return unquote(location.rsplit("/releases/tag/", 1)[1]) or None
+
+
+async def get_latest_release(client: httpx.AsyncClient, owner: str, repo: str, token: Optional[str]) -> Dict[str, Any]:
+    key = (owner, repo)
+    if key not in _release_requests:
+        _release_requests[key] = asyncio.ensure_future(_fetch_latest_release(client, owner, repo, token))
+    return await _release_requests[key]
+
+
+async def _fetch_latest_release(client: httpx.AsyncClient, owner: str, repo: str, token: Optional[str]) -> Dict[str, Any]:
     url = f"https://api.github.com/repos/{owner}/{repo}/releases/latest"
     headers = {}
     if token:
@@ -52,38 +376,56 @@ def get_latest_release(owner: str, repo: str, token: Optional[str]) -> Dict[str,
     headers.setdefault("Accept", "application/vnd.github+json")
     headers.setdefault("X-GitHub-Api-Version", "2022-11-28")
     headers.setdefault("User-Agent", "longred-forge-recipe-updater")
-    r = httpx.get(url, headers=headers, timeout=DEFAULT_HTTP_TIMEOUT)
+    # A 304 carries no body and doesn't count against the rate limit.
+    return await conditional_get_json(client, url, RELEASES_CACHE, f"{owner}/{repo}", headers)
+
+
+async def conditional_get_json(
+    client: httpx.AsyncClient, url: str, cache: JsonCache, key: str, headers: Optional[Dict[str, str]] = None
+) -> Any:
+    """GET a JSON document, revalidating a cached copy with If-None-Match / If-Modified-Since."""
+    headers = dict(headers or {})
+    cached = cache.get(key)
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+    r = await limited_get(client, url, headers=headers, timeout=DEFAULT_HTTP_TIMEOUT)
+    if r.status_code == 304 and cached:
+        return cached["body"]
     r.raise_for_status()
-    return r.json()
-
+    body = r.json()
+    if r.headers.get("ETag") or r.headers.get("Last-Modified"):
+        cache.set(key, {"etag": r.headers.get("ETag"), "last_modified": r.headers.get("Last-Modified"), "body": body})
+    return body
 
-def sha256_hex_bytes(data: bytes) -> str:
-    return hashlib.sha256(data).hexdigest()
 
+@functools.lru_cache(maxsize=32)
+def parse_checksum_txt(txt: str) -> Dict[str, str]:
+    """Parse a checksum listing into {filename: hash}.
 
-def digest_from_checksum_txt(filename: str, txt: str) -> Optional[str]:
-    for line in txt.splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        # common formats: <hash> <filename>
-        if line.endswith(filename):
-            parts = line.split()
-            if len(parts) >= 1:
-                return parts[0]
-    return None
+    Handles the common `<hash>  <filename>` and `<hash> *<filename>` formats. Only
+    sha256-sized hex digests are taken, so neither an HTML error page nor a listing of
+    another algorithm (SHA512SUMS also matches the "sha" name filter) yields one; entries
+    with a directory prefix are also indexed by their basename. The first entry for a
+    name wins. Callers must treat the result as read-only since it is memoized.
+    """
+    digests: Dict[str, str] = {}
+    for digest, name in _CHECKSUM_LINE_RE.findall(txt):
+        digests.setdefault(name, digest)
+        digests.setdefault(name.rsplit("/", 1)[-1], digest)
+    return digests
 
 
-def get_gcs_checksums(version: str) -> Dict[str, str]:
+async def get_gcs_checksums(client: httpx.AsyncClient, version: str) -> Dict[str, str]:
     """Fetch SHA-256 checksums from GCS manifest.json for a given claude-code version.
 
     Returns a dict mapping GCS platform names to sha256 hex strings, e.g.:
       {"linux-x64": "abc123...", "linux-arm64": "def456...", ...}
     """
     manifest_url = f"{CLAUDE_CODE_GCS_BUCKET}/{version}/manifest.json"
-    r = httpx.get(manifest_url, timeout=DEFAULT_HTTP_TIMEOUT)
-    r.raise_for_status()
-    manifest = r.json()
+    manifest = await conditional_get_json(client, manifest_url, GCS_MANIFESTS_CACHE, version)
     platforms = manifest.get("platforms", {})
     result: Dict[str, str] = {}
     for platform, info in platforms.items():
@@ -93,92 +435,99 @@ def get_gcs_checksums(version: str) -> Dict[str, str]:
         if checksum:
             result[platform] = checksum
         else:
-            print(f"Warning: missing checksum for platform {platform} in GCS manifest")
+            log.warning("Missing checksum for platform %s in GCS manifest", platform)
     return result
 
 
-def gcs_platform_for_if_cond(if_cond: str) -> Optional[str]:
-    """Map a recipe if-condition string to the corresponding GCS platform name."""
-    if "linux" in if_cond and "x86_64" in if_cond:
-        return "linux-x64"
-    if "linux" in if_cond and "aarch64" in if_cond:
-        return "linux-arm64"
-    if "osx" in if_cond and "x86_64" in if_cond:
-        return "darwin-x64"
-    if "osx" in if_cond and "arm64" in if_cond:
-        return "darwin-arm64"
+@functools.lru_cache(maxsize=64)
+def platform_for_if_cond(if_cond: str) -> Optional[Tuple[str, str]]:
+    """Parse a recipe if-condition such as "linux and aarch64" into an (os, arch) pair.
+
+    arm64 and aarch64 are both normalized to "arm64".
+    """
+    if "linux" in if_cond:
+        os_name = "linux"
+    elif "osx" in if_cond:
+        os_name = "osx"
+    elif "win" in if_cond:
+        os_name = "win"
+    else:
+        return None
+    if "x86_64" in if_cond:
+        return os_name, "x86_64"
+    if "aarch64" in if_cond or "arm64" in if_cond:
+        return os_name, "arm64"
     return None
 
 
-def asset_name_for(if_cond: str, version_tag: str, repo: Optional[str] = None) -> Optional[str]:
-    v = version_tag.lstrip("v")
-    # Support multiple naming patterns for different tools
-
-    if repo and repo.lower() == "hatchet":
-        # Hatchet pattern: hatchet_<version>_<OS>_<ARCH>.tar.gz
-        if "linux" in if_cond and "x86_64" in if_cond:
-            return f"hatchet_{v}_Linux_x86_64.tar.gz"
-        if "linux" in if_cond and "aarch64" in if_cond:
-            return f"hatchet_{v}_Linux_arm64.tar.gz"
-        if "osx" in if_cond and "x86_64" in if_cond:
-            return f"hatchet_{v}_Darwin_x86_64.tar.gz"
-        if "osx" in if_cond and "arm64" in if_cond:
-            return f"hatchet_{v}_Darwin_arm64.tar.gz"
-
-    if repo and repo.lower() == "copilot-cli":
-        # Copilot-CLI pattern: copilot-<os>-<arch>.tar.gz
-        if "linux" in if_cond and "x86_64" in if_cond:
-            return "copilot-linux-x64.tar.gz"
-        if "linux" in if_cond and "aarch64" in if_cond:
-            return "copilot-linux-arm64.tar.gz"
-        if "osx" in if_cond and "x86_64" in if_cond:
-            return "copilot-darwin-x64.tar.gz"
-        if "osx" in if_cond and "arm64" in if_cond:
-            return "copilot-darwin-arm64.tar.gz"
-
-    if repo and repo.lower() == "opencode":
-        # OpenCode pattern: opencode-<os>-<arch>.tar.gz or .zip
-        if "linux" in if_cond and "x86_64" in if_cond:
-            return "opencode-linux-x64.tar.gz"
-        if "linux" in if_cond and "aarch64" in if_cond:
-            return "opencode-linux-arm64.tar.gz"
-        if "osx" in if_cond and "x86_64" in if_cond:
-            return "opencode-darwin-x64.zip"
-        if "osx" in if_cond and "arm64" in if_cond:
-            return "opencode-darwin-arm64.zip"
-
-    if repo and repo.lower() == "radar":
-        # Radar pattern: radar_v<version>_<os>_<arch>.tar.gz
-        if "linux" in if_cond and "x86_64" in if_cond:
-            return f"radar_v{v}_linux_amd64.tar.gz"
-        if "linux" in if_cond and "aarch64" in if_cond:
-            return f"radar_v{v}_linux_arm64.tar.gz"
-        if "osx" in if_cond and "x86_64" in if_cond:
-            return f"radar_v{v}_darwin_amd64.tar.gz"
-        if "osx" in if_cond and "arm64" in if_cond:
-            return f"radar_v{v}_darwin_arm64.tar.gz"
-
-    if repo and repo.lower() == "garage-webui":
-        # garage-webui pattern: garage-webui-v<version>-linux-<arch>
-        if "linux" in if_cond and "x86_64" in if_cond:
-            return f"garage-webui-v{v}-linux-amd64"
-        if "linux" in if_cond and "arm64" in if_cond:
-            return f"garage-webui-v{v}-linux-arm64"
-
-    if repo and repo.lower() == "mimocode":
-        # MiMo-Code pattern: mimocode-<os>-<arch>.tar.gz or .zip
-        if "linux" in if_cond and "x86_64" in if_cond:
-            return "mimocode-linux-x64.tar.gz"
-        if "linux" in if_cond and "aarch64" in if_cond:
-            return "mimocode-linux-arm64.tar.gz"
-        if "osx" in if_cond and "x86_64" in if_cond:
-            return "mimocode-darwin-x64.zip"
-        if "osx" in if_cond and "arm64" in if_cond:
-            return "mimocode-darwin-arm64.zip"
-        if "win" in if_cond and "x86_64" in if_cond:
-            return "mimocode-windows-x64.zip"
+# GCS platform names (claude-code manifest keys) per (os, arch)
+GCS_PLATFORMS: Dict[Tuple[str, str], str] = {
+    ("linux", "x86_64"): "linux-x64",
+    ("linux", "arm64"): "linux-arm64",
+    ("osx", "x86_64"): "darwin-x64",
+    ("osx", "arm64"): "darwin-arm64",
+}
 
-    return None
+
+def gcs_platform_for_if_cond(if_cond: str) -> Optional[str]:
+    """Map a recipe if-condition string to the corresponding GCS platform name."""
+    platform = platform_for_if_cond(if_cond)
+    return GCS_PLATFORMS.get(platform) if platform else None
+
+
+# Release asset names of known tools per (os, arch); "{v}" is the version without a leading "v".
+ASSET_NAME_PATTERNS: Dict[str, Dict[Tuple[str, str], str]] = {
+    # Hatchet pattern: hatchet_<version>_<OS>_<ARCH>.tar.gz
+    "hatchet": {
+        ("linux", "x86_64"): "hatchet_{v}_Linux_x86_64.tar.gz",
+        ("linux", "arm64"): "hatchet_{v}_Linux_arm64.tar.gz",
+        ("osx", "x86_64"): "hatchet_{v}_Darwin_x86_64.tar.gz",
+        ("osx", "arm64"): "hatchet_{v}_Darwin_arm64.tar.gz",
+    },
+    # Copilot-CLI pattern: copilot-<os>-<arch>.tar.gz
+    "copilot-cli": {
+        ("linux", "x86_64"): "copilot-linux-x64.tar.gz",
+        ("linux", "arm64"): "copilot-linux-arm64.tar.gz",
+        ("osx", "x86_64"): "copilot-darwin-x64.tar.gz",
+        ("osx", "arm64"): "copilot-darwin-arm64.tar.gz",
+    },
+    # OpenCode pattern: opencode-<os>-<arch>.tar.gz or .zip
+    "opencode": {
+        ("linux", "x86_64"): "opencode-linux-x64.tar.gz",
+        ("linux", "arm64"): "opencode-linux-arm64.tar.gz",
+        ("osx", "x86_64"): "opencode-darwin-x64.zip",
+        ("osx", "arm64"): "opencode-darwin-arm64.zip",
+    },
+    # Radar pattern: radar_v<version>_<os>_<arch>.tar.gz
+    "radar": {
+        ("linux", "x86_64"): "radar_v{v}_linux_amd64.tar.gz",
+        ("linux", "arm64"): "radar_v{v}_linux_arm64.tar.gz",
+        ("osx", "x86_64"): "radar_v{v}_darwin_amd64.tar.gz",
+        ("osx", "arm64"): "radar_v{v}_darwin_arm64.tar.gz",
+    },
+    # garage-webui pattern: garage-webui-v<version>-linux-<arch>
+    "garage-webui": {
+        ("linux", "x86_64"): "garage-webui-v{v}-linux-amd64",
+        ("linux", "arm64"): "garage-webui-v{v}-linux-arm64",
+    },
+    # MiMo-Code pattern: mimocode-<os>-<arch>.tar.gz or .zip
+    "mimocode": {
+        ("linux", "x86_64"): "mimocode-linux-x64.tar.gz",
+        ("linux", "arm64"): "mimocode-linux-arm64.tar.gz",
+        ("osx", "x86_64"): "mimocode-darwin-x64.zip",
+        ("osx", "arm64"): "mimocode-darwin-arm64.zip",
+        ("win", "x86_64"): "mimocode-windows-x64.zip",
+    },
+}
+
+
+@functools.lru_cache(maxsize=256)
+def asset_name_for(if_cond: str, version_tag: str, repo: Optional[str] = None) -> Optional[str]:
+    patterns = ASSET_NAME_PATTERNS.get(repo.lower()) if repo else None
+    platform = platform_for_if_cond(if_cond) if patterns else None
+    if not patterns or not platform or platform not in patterns:
+        return None
+    return patterns[platform].format(v=version_tag.lstrip("v"))
 
 
 def asset_name_from_recipe_pattern(recipe_url: Optional[str], if_cond: str, version: Optional[str]) -> Optional[str]:
@@ -187,14 +536,13 @@ def asset_name_from_recipe_pattern(recipe_url: Optional[str], if_cond: str, vers
         return None
     # Extract pattern like copilot-linux-x64.tar.gz, radar_v${{ version }}_linux_amd64.tar.gz,
     # or direct binary assets such as deepseek-linux-x64.
-    import re
     # Substitute version placeholder with provided version (if available)
     url_pattern = recipe_url.replace("${{ version }}", str(version) if version is not None else "")
     url_pattern = url_pattern.strip()
     if "{" in url_pattern:  # Skip if unresolved other variables remain
         return None
     # Extract just the filename.
-    m = re.search(r'/([^/]+)$', url_pattern)
+    m = _BASENAME_RE.search(url_pattern)
     if m:
         filename = m.group(1)
         if VALID_ASSET_BASENAME_PATTERN.fullmatch(filename):
@@ -202,56 +550,198 @@ def asset_name_from_recipe_pattern(recipe_url: Optional[str], if_cond: str, vers
     return None
 
 
-def find_asset(assets: List[Dict[str, Any]], name: str) -> Optional[Dict[str, Any]]:
-    for a in assets:
-        if a.get("name") == name:
-            return a
-    return None
+def asset_cache_key(asset: Dict[str, Any]) -> Optional[str]:
+    """Identify one upload of a release asset, for caches of anything derived from its bytes.
+
+    GitHub bumps updated_at (and usually size) whenever an asset is re-uploaded under the
+    same id, so data recorded for this triple is still valid.
+    """
+    if asset.get("id") is None:
+        return None
+    return f"{asset['id']}:{asset.get('updated_at')}:{asset.get('size')}"
 
 
-def compute_sha_for_asset(asset: Dict[str, Any], headers: Dict[str, str]) -> str:
-    # Use asset.digest if present
+def shared_checksum_urls(assets_by_name: Dict[str, Dict[str, Any]]) -> List[str]:
+    """Download URLs of the release-wide checksum listings (SHA256SUMS, checksums.txt, ...).
+
+    Sidecars belong to a single asset, so other assets' sidecars are left out.
+    """
+    urls: List[str] = []
+    for name, asset in assets_by_name.items():
+        if "sha" in name.lower() or "checksum" in name.lower():
+            sidecar_of = next((name[: -len(s)] for s in CHECKSUM_SUFFIXES if name.endswith(s)), None)
+            if sidecar_of in assets_by_name:
+                continue
+            url: Optional[str] = asset.get("browser_download_url")
+            if url:
+                urls.append(url)
+    return urls
+
+
+class ChecksumFiles:
+    """The checksum files of one release, each fetched at most once and parsed on demand."""
+
+    def __init__(self, client: httpx.AsyncClient, headers: Dict[str, str], assets_by_name: Dict[str, Dict[str, Any]]):
+        self.client = client
+        self.headers = headers
+        self.shared_urls = shared_checksum_urls(assets_by_name)
+        self._assets_by_url = {
+            a["browser_download_url"]: a for a in assets_by_name.values() if a.get("browser_download_url")
+        }
+        self._fetches: Dict[str, "asyncio.Task[Optional[Dict[str, str]]]"] = {}
+
+    def prefetch_shared(self) -> None:
+        """Start fetching the release-wide listings ahead of the per-asset lookups.
+
+        Only assets that are unmistakably small checksum listings are fetched eagerly; other
+        "sha"/"checksum" names are left to the lazy scan after a sidecar lookup fails.
+        """
+        for asset in self._assets_by_url.values():
+            if (
+                asset["browser_download_url"] in self.shared_urls
+                and CHECKSUM_LISTING_PATTERN.search(asset.get("name", ""))
+                and (asset.get("size") or 0) <= MAX_PREFETCH_LISTING_SIZE
+            ):
+                self.fetch(asset["browser_download_url"])
+
+    async def _fetch(self, url: str) -> Optional[Dict[str, str]]:
+        # A downloaded listing is kept on disk and reused by later runs. It is keyed by the
+        # checksum asset's (id, updated_at, size) rather than its URL, so a listing that is
+        # re-uploaded under the same tag is fetched again.
+        asset_key = asset_cache_key(self._assets_by_url.get(url) or {})
+        path = None
+        if asset_key:
+            path = os.path.join(CHECKSUM_CACHE_DIR, hashlib.sha1(asset_key.encode()).hexdigest() + ".txt")
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    return parse_checksum_txt(f.read())
+            except OSError:
+                pass
+        try:
+            r = await limited_get(self.client, url, headers=self.headers, timeout=DEFAULT_HTTP_TIMEOUT)
+        except httpx.HTTPError as e:
+            log.warning("Failed to fetch checksum file: %s", e)
+            return None
+        digests = parse_checksum_txt(r.text)
+        if path and r.is_success and digests:
+            try:
+                os.makedirs(CHECKSUM_CACHE_DIR, exist_ok=True)
+                tmp = f"{path}.{os.getpid()}.tmp"
+                with open(tmp, "w", encoding="utf-8") as f:
+                    f.write(r.text)
+                os.replace(tmp, path)
+            except OSError as e:
+                log.warning("Could not write cache %s: %s", path, e)
+        return digests
+
+    def fetch(self, url: str) -> "asyncio.Task[Optional[Dict[str, str]]]":
+        task = self._fetches.get(url)
+        if task is None:
+            task = self._fetches[url] = asyncio.ensure_future(self._fetch(url))
+        return task
+
+    async def first_digest(self, urls: List[str], filename: str) -> Optional[str]:
+        """Fetch ``urls`` concurrently and return the first digest found for ``filename``.
+
+        Fetches still running when a digest is found are left going: other assets of the
+        release are likely to need the same files.
+        """
+        if not urls:
+            return None
+        for fut in asyncio.as_completed([self.fetch(url) for url in urls]):
+            digests = await fut
+            if digests and digests.get(filename):
+                return digests[filename]
+        return None
+
+    async def aclose(self) -> None:
+        for task in self._fetches.values():
+            task.cancel()
+        await asyncio.gather(*self._fetches.values(), return_exceptions=True)
+
+
+def index_assets(assets: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Index release assets by name for O(1) lookups."""
+    return {a["name"]: a for a in assets if a.get("name")}
+
+
+def sha_from_asset_digest(asset: Dict[str, Any]) -> Optional[str]:
+    """The sha256 GitHub reports for an asset (``"sha256:<hex>"``), if any."""
     digest = asset.get("digest")
     if digest:
-        m = re.search(r"sha-?256:?(.*)", str(digest), re.IGNORECASE)
+        m = _SHA256_DIGEST_RE.search(str(digest))
         if m:
             return m.group(1).strip()
+    return None
 
+
+async def compute_sha_for_asset(
+    client: httpx.AsyncClient,
+    asset: Dict[str, Any],
+    assets_by_name: Dict[str, Dict[str, Any]],
+    checksum_files: ChecksumFiles,
+    headers: Dict[str, str],
+) -> str:
+    # Use asset.digest if present
+    digest = sha_from_asset_digest(asset)
+    if digest:
+        return digest
+
+    cache_key = asset_cache_key(asset)
+    if cache_key:
+        cached = ASSET_SHA_CACHE.get(cache_key)
+        if cached:
+            return cached
+    sha = await _sha_from_checksums_or_download(client, asset, assets_by_name, checksum_files, headers)
+    if cache_key:
+        ASSET_SHA_CACHE.set(cache_key, sha)
+    return sha
+
+
+async def _sha_from_checksums_or_download(
+    client: httpx.AsyncClient,
+    asset: Dict[str, Any],
+    assets_by_name: Dict[str, Dict[str, Any]],
+    checksum_files: ChecksumFiles,
+    headers: Dict[str, str],
+) -> str:
     # Look for checksum asset
     asset_name: Optional[str] = asset.get("name")
     if not asset_name:
         raise RuntimeError("asset has no name")
     # try common checksum suffixes
-    possible_suffixes = [".sha256", ".sha256sum", ".sha256.txt", ".sha256sums"]
-    release_assets: List[Dict[str, Any]] = asset.get("_release_assets_cache") or []
-    for s in possible_suffixes:
-        candidate = next((x for x in release_assets if x.get("name") == asset_name + s), None)
-        if candidate:
-            candidate_url: Optional[str] = candidate.get("browser_download_url")
-            if candidate_url:
-                txt = httpx.get(candidate_url, headers=headers, timeout=DEFAULT_HTTP_TIMEOUT).text
-                got = digest_from_checksum_txt(asset_name, txt)
-                if got:
-                    return got
-
-    # Try to find any checksum file in the release assets that contains the filename
-    for cand in release_assets:
-        cand_name: Optional[str] = cand.get("name")
-        if cand_name and ("sha" in cand_name.lower() or "checksum" in cand_name.lower()):
-            cand_url: Optional[str] = cand.get("browser_download_url")
-            if cand_url:
-                txt = httpx.get(cand_url, headers=headers, timeout=DEFAULT_HTTP_TIMEOUT).text
-                got = digest_from_checksum_txt(asset_name, txt)
-                if got:
-                    return got
+    sidecar_urls: List[str] = []
+    for s in CHECKSUM_SUFFIXES:
+        candidate = assets_by_name.get(asset_name + s)
+        if candidate and candidate.get("browser_download_url"):
+            sidecar_urls.append(candidate["browser_download_url"])
+    got = await checksum_files.first_digest(sidecar_urls, asset_name)
+    if got:
+        return got
+
+    # Try to find any checksum file in the release assets that contains the filename.
+    got = await checksum_files.first_digest(checksum_files.shared_urls, asset_name)
+    if got:
+        return got
 
     # Last resort: download asset and compute
     url = asset.get("browser_download_url")
     if not url:
         raise RuntimeError("asset has no download url")
-    r = httpx.get(url, headers=headers, timeout=ASSET_DOWNLOAD_TIMEOUT)
-    r.raise_for_status()
-    return sha256_hex_bytes(r.content)
+    # Hash while streaming so memory stays bounded regardless of the asset size. Each chunk
+    # is hashed off the event loop while the next one is being received.
+    h = hashlib.sha256()
+    loop = asyncio.get_running_loop()
+    pending: Optional["asyncio.Future[None]"] = None
+    async with limited_stream(client, "GET", url, headers=headers, timeout=ASSET_DOWNLOAD_TIMEOUT) as r:
+        r.raise_for_status()
+        async for chunk in r.aiter_bytes(HASH_CHUNK_SIZE):
+            if pending is not None:
+                await pending
+            pending = loop.run_in_executor(HASH_POOL, h.update, chunk)
+    if pending is not None:
+        await pending
+    return h.hexdigest()
 
 
 def parse_owner_repo_from_url(url: str):
@@ -259,15 +749,10 @@ def parse_owner_repo_from_url(url: str):
     if not url:
         return None
     url = url.strip()
-    m = re.match(r"git@github.com:(?P<owner>[^/]+)/(?P<repo>[^/.]+)(?:\.git)?", url)
-    if m:
-        return m.group("owner"), m.group("repo")
-    m = re.match(r"https?://github.com/(?P<owner>[^/]+)/(?P<repo>[^/]+)(?:\.git)?", url)
+    m = GITHUB_REPO_URL_PATTERN.match(url)
     if m:
         return m.group("owner"), m.group("repo")
     try:
-        from urllib.parse import urlparse
-
         p = urlparse(url)
         parts = [seg for seg in p.path.split("/") if seg]
         if len(parts) >= 2:
@@ -280,52 +765,162 @@ def parse_owner_repo_from_url(url: str):
     return None
 
 
-def update_single_recipe(recipe_path: str, owner: Optional[str], repo: Optional[str], headers: Dict[str, str], token: Optional[str], apply: bool, dry: bool) -> None:
+def _peek_scalar(pattern: re.Pattern, raw: str) -> Optional[str]:
+    m = pattern.search(raw)
+    if not m:
+        return None
+    value = m.group(1)
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "'\"":
+        value = value[1:-1]
+    return value or None
+
+
+def _peek_version(raw: str) -> Optional[str]:
+    """Return the recipe's `context.version` without parsing the whole document."""
+    return _peek_scalar(_CONTEXT_VERSION_RE, raw)
+
+
+def _peek_repository(raw: str) -> Optional[str]:
+    """Return the recipe's `about.repository` if it is a plain GitHub URL on its own line.
+
+    Anything else (a trailing comment, a block scalar, a non-GitHub URL) returns None, so
+    the caller falls back to a real YAML parse.
+    """
+    value = _peek_scalar(_ABOUT_REPOSITORY_RE, raw)
+    if value and not any(c.isspace() for c in value) and GITHUB_REPO_URL_PATTERN.fullmatch(value):
+        return value
+    return None
+
+
+def find_recipe_files() -> List[str]:
+    """List recipes/<name>/recipe.yaml files, sorted."""
+    try:
+        with os.scandir("recipes") as it:
+            files = [
+                os.path.join("recipes", entry.name, "recipe.yaml")
+                for entry in it
+                if entry.is_dir(follow_symlinks=False) and os.path.isfile(os.path.join(entry.path, "recipe.yaml"))
+            ]
+    except FileNotFoundError:
+        return []
+    return sorted(files)
+
+
+def _source_shas(doc: Dict[str, Any]) -> List[Any]:
+    """sha256 values of the recipe's source items, in document order."""
+    shas: List[Any] = []
+    sources = doc.get("source")
+    for src in sources if isinstance(sources, list) else []:
+        if not isinstance(src, dict):
+            continue
+        items = (src.get("then") or []) if "then" in src else [src]
+        shas.extend(item["sha256"] for item in items if isinstance(item, dict) and "sha256" in item)
+    return shas
+
+
+def patch_recipe_text(raw: str, doc: Dict[str, Any]) -> Optional[str]:
+    """Write the updated `context.version` and source `sha256` values of ``doc`` into ``raw``.
+
+    Only those scalars are replaced, so comments and formatting survive and the document
+    doesn't have to be dumped. Returns None when the text can't be patched faithfully:
+    the sha256 lines don't line up with the source items, or the result doesn't parse
+    back to ``doc``.
+    """
+    version_match = _CONTEXT_VERSION_RE.search(raw)
+    sha_matches = list(_SHA256_LINE_RE.finditer(raw))
+    shas = _source_shas(doc)
+    if not version_match or len(sha_matches) != len(shas):
+        return None
+    edits = [(version_match.span(1), str(doc["context"]["version"]))]
+    edits += [(m.span(1), str(sha)) for m, sha in zip(sha_matches, shas)]
+    parts: List[str] = []
+    pos = 0
+    for (start, end), value in sorted(edits):
+        parts += [raw[pos:start], value]
+        pos = end
+    parts.append(raw[pos:])
+    out = "".join(parts)
+    try:
+        if yaml.load(out, Loader=YamlLoader) != doc:
+            return None
+    except yaml.YAMLError:
+        return None
+    return out
+
+
+async def update_single_recipe(
+    client: httpx.AsyncClient,
+    recipe_path: str,
+    owner: Optional[str],
+    repo: Optional[str],
+    headers: Dict[str, str],
+    token: Optional[str],
+    apply: bool,
+    dry: bool,
+) -> None:
     """Update a single recipe file in-place (or show preview if dry)."""
-    print(f"Processing recipe: {recipe_path}")
+    rlog = RecipeLog(log, {"recipe": os.path.basename(os.path.dirname(os.path.abspath(recipe_path)))})
+    rlog.info("Processing recipe: %s", recipe_path)
     with open(recipe_path, "r", encoding="utf-8") as f:
         raw = f.read()
-    doc = yaml.safe_load(raw)
 
-    # Determine owner/repo from recipe if not provided
-    repo_url = None
-    about = doc.get("about") or {}
-    if isinstance(about, dict):
-        repo_url = about.get("repository")
+    # Determine owner/repo from recipe if not provided. The full YAML parse is deferred
+    # until the recipe actually needs updating; only fall back to it here when the
+    # repository can't be read off the raw text.
+    doc: Optional[Dict[str, Any]] = None
+    repo_url = _peek_repository(raw)
+    if not repo_url:
+        doc = yaml.load(raw, Loader=YamlLoader)
+        about = doc.get("about") or {}
+        if isinstance(about, dict):
+            repo_url = about.get("repository")
     parsed = parse_owner_repo_from_url(repo_url) if repo_url else None
     if parsed:
         owner_from_recipe, repo_from_recipe = parsed
-        print(f"Detected owner/repo from recipe: {owner_from_recipe}/{repo_from_recipe}")
+        rlog.info("Detected owner/repo from recipe: %s/%s", owner_from_recipe, repo_from_recipe)
         owner = owner_from_recipe
         repo = repo_from_recipe
 
     if not owner or not repo:
-        print("Owner/repo not set and not found in recipe. Skipping this recipe.")
+        rlog.warning("Owner/repo not set and not found in recipe. Skipping this recipe.")
+        return
+
+    # Up to date according to the prefetched or redirect-peeked tag: no need to fetch the
+    # release itself.
+    known_tag = _latest_tags.get((owner, repo)) or await peek_latest_tag(client, owner, repo)
+    if known_tag and _peek_version(raw) == known_tag.lstrip("v"):
+        rlog.info("Latest upstream release: %s", known_tag)
+        rlog.info("Recipe already at version %s", known_tag.lstrip("v"))
         return
 
-    release = get_latest_release(owner, repo, token)
+    release = await get_latest_release(client, owner, repo, token)
     tag = release.get("tag_name")
     if not tag:
-        print("No tag_name found in release; skipping")
+        rlog.warning("No tag_name found in release; skipping")
         return
     version = tag.lstrip("v")
-    print(f"Latest upstream release: {tag}")
+    rlog.info("Latest upstream release: %s", tag)
 
+    if _peek_version(raw) == version:
+        rlog.info("Recipe already at version %s", version)
+        return
+
+    if doc is None:
+        doc = yaml.load(raw, Loader=YamlLoader)
     if doc.get("context", {}).get("version") == version:
-        print(f"Recipe already at version {version}")
+        rlog.info("Recipe already at version %s", version)
         return
 
     # update version
     doc.setdefault("context", {})
     doc["context"]["version"] = str(version)
 
-    assets = release.get("assets", [])
-    # attach release assets cache for checksum lookups
-    for a in assets:
-        a["_release_assets_cache"] = assets
+    assets_by_name = index_assets(release.get("assets", []))
 
     # Pre-fetch GCS checksums if any source URL references the claude-code GCS bucket
     gcs_checksums: Optional[Dict[str, str]] = None
+    # Release assets to hash, resolved once all source items have been matched.
+    pending: List[Tuple[Dict[str, Any], str, Dict[str, Any]]] = []
 
     if isinstance(doc.get("source"), list):
         for src in doc["source"]:
@@ -369,18 +964,18 @@ def update_single_recipe(recipe_path: str, owner: Optional[str], repo: Optional[
                 if is_gcs_source:
                     if gcs_checksums is None:
                         try:
-                            gcs_checksums = get_gcs_checksums(version)
-                            print(f"Fetched GCS checksums for version {version}")
+                            gcs_checksums = await get_gcs_checksums(client, version)
+                            rlog.info("Fetched GCS checksums for version %s", version)
                         except Exception as e:
-                            print(f"Failed to fetch GCS checksums: {e}")
+                            rlog.warning("Failed to fetch GCS checksums: %s", e)
                             gcs_checksums = {}
                     gcs_platform = gcs_platform_for_if_cond(if_cond)
                     if gcs_platform and gcs_checksums.get(gcs_platform):
                         sha = gcs_checksums[gcs_platform]
-                        print(f"Using GCS sha for {gcs_platform}: {sha}")
+                        rlog.info("Using GCS sha for %s: %s", gcs_platform, sha)
                         item["sha256"] = sha
                     else:
-                        print(f"GCS checksum not found for platform: {gcs_platform}")
+                        rlog.warning("GCS checksum not found for platform: %s", gcs_platform)
                     continue
                 
                 # Try hardcoded patterns first (for known repos like hatchet), then try URL-based pattern
@@ -391,43 +986,149 @@ def update_single_recipe(recipe_path: str, owner: Optional[str], repo: Optional[
                 
                 # For simple URLs, extract the filename directly
                 if not expected and not if_cond:
-                    import re
-                    m = re.search(r'/([^/]+)$', recipe_url)
+                    m = _BASENAME_RE.search(recipe_url)
                     if m:
                         expected = m.group(1)
                 
                 if not expected:
-                    print(f"Could not determine asset name for url: {recipe_url}")
+                    rlog.warning("Could not determine asset name for url: %s", recipe_url)
                     continue
                 
-                asset = find_asset(assets, expected)
+                asset = assets_by_name.get(expected)
                 if not asset:
-                    print(f"No matching asset found for {expected}")
+                    rlog.warning("No matching asset found for %s", expected)
                     continue
-                try:
-                    sha = compute_sha_for_asset(asset, headers)
-                except Exception as e:
-                    print(f"Failed to compute sha for {expected}: {e}")
-                    continue
-                print(f"Using sha for {expected}: {sha}")
-                item["sha256"] = sha
+                pending.append((item, expected, asset))
+
+    # Assets carrying a digest resolve without a request. The rest are hashed concurrently
+    # and share one ChecksumFiles, so a release-wide SHA256SUMS is downloaded only once.
+    to_fetch: List[Tuple[Dict[str, Any], str, Dict[str, Any]]] = []
+    for item, expected, asset in pending:
+        sha = sha_from_asset_digest(asset)
+        if sha:
+            rlog.info("Using sha for %s: %s", expected, sha)
+            item["sha256"] = sha
+        else:
+            to_fetch.append((item, expected, asset))
+    checksum_files = ChecksumFiles(client, headers, assets_by_name)
+    if to_fetch:
+        checksum_files.prefetch_shared()
+    try:
+        results = await asyncio.gather(
+            *(
+                compute_sha_for_asset(client, asset, assets_by_name, checksum_files, headers)
+                for _, _, asset in to_fetch
+            ),
+            return_exceptions=True,
+        )
+        for (item, expected, _), result in zip(to_fetch, results):
+            if isinstance(result, Exception):
+                rlog.warning("Failed to compute sha for %s: %s", expected, result)
+                continue
+            rlog.info("Using sha for %s: %s", expected, result)
+            item["sha256"] = result
+    finally:
+        await checksum_files.aclose()
 
-    out = "# yaml-language-server: $schema=https://raw.githubusercontent.com/prefix-dev/recipe-format/main/schema.json\n" + yaml.safe_dump(doc, sort_keys=False)
+    out = patch_recipe_text(raw, doc)
+    if out is None:
+        rlog.debug("Could not patch recipe text in place; re-rendering it")
 
     if dry:
-        print("--- Updated recipe preview ---")
-        print(out)
-        print("--- end preview ---")
-        print("(dry-run) not writing changes for this recipe")
+        if out is None:
+            out = _YAML_HEADER + yaml.dump(doc, Dumper=YamlDumper, sort_keys=False)
+        rlog.info("--- Updated recipe preview ---\n%s--- end preview ---", out)
+        rlog.info("(dry-run) not writing changes for this recipe")
         return
 
     with open(recipe_path, "w", encoding="utf-8") as f:
-        f.write(out)
-    print(f"Wrote updated recipe with version {version}")
+        if out is not None:
+            f.write(out)
+        else:
+            # Stream the dump rather than building the whole document as a string first.
+            f.write(_YAML_HEADER)
+            yaml.dump(doc, f, Dumper=YamlDumper, sort_keys=False)
+    rlog.info("Wrote updated recipe with version %s", version)
+
+
+def make_client() -> httpx.AsyncClient:
+    """Create the HTTP client shared by all requests of a run.
+
+    Connections are pooled and kept alive across recipes; with h2 installed, requests to the
+    same host are multiplexed over HTTP/2. Auth headers are passed per request so tokens are
+    only sent to GitHub.
+    """
+    return httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        # Release download URLs redirect to GitHub's CDN.
+        follow_redirects=True,
+        headers={"User-Agent": "longred-forge-recipe-updater"},
+        timeout=httpx.Timeout(DEFAULT_HTTP_TIMEOUT, read=ASSET_DOWNLOAD_TIMEOUT),
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+    )
+
+
+async def update_recipe(
+    recipe_path: str,
+    owner: Optional[str],
+    repo: Optional[str],
+    headers: Dict[str, str],
+    token: Optional[str],
+    apply: bool,
+    dry: bool,
+) -> None:
+    async with make_client() as client:
+        await update_single_recipe(client, recipe_path, owner, repo, headers, token, apply, dry)
+
+
+def recipe_targets(files: List[str], owner: Optional[str], repo: Optional[str]) -> List[Tuple[str, str]]:
+    """The GitHub owner/repo each recipe tracks, as far as it can be read off the raw text."""
+    targets: List[Tuple[str, str]] = []
+    for fp in files:
+        try:
+            with open(fp, "r", encoding="utf-8") as f:
+                repo_url = _peek_repository(f.read())
+        except OSError:
+            continue
+        parsed = parse_owner_repo_from_url(repo_url) if repo_url else None
+        if parsed:
+            targets.append(parsed)
+        elif owner and repo:
+            targets.append((owner, repo))
+    return targets
+
+
+async def update_recipes(
+    files: List[str],
+    owner: Optional[str],
+    repo: Optional[str],
+    headers: Dict[str, str],
+    token: Optional[str],
+    apply: bool,
+    dry: bool,
+) -> None:
+    """Update several recipes concurrently over one shared HTTP client."""
+    limit = asyncio.Semaphore(MAX_CONCURRENT_RECIPES)
+
+    async def update_bounded(client: httpx.AsyncClient, fp: str) -> None:
+        async with limit:
+            await update_single_recipe(client, fp, owner, repo, headers, token, apply, dry)
+
+    async with make_client() as client:
+        if token:
+            await prefetch_latest_tags(client, recipe_targets(files, owner, repo), token)
+        results = await asyncio.gather(*(update_bounded(client, fp) for fp in files), return_exceptions=True)
+    for fp, result in zip(files, results):
+        if isinstance(result, Exception):
+            log.error("Failed to update %s: %s", fp, result)
 
 
 def main():
     args = parse_args()
+    logging.basicConfig(level=os.environ.get("LOGLEVEL", "INFO").upper(), format="%(message)s", stream=sys.stdout)
+    # httpx logs every request at INFO; only show that when debugging.
+    if not log.isEnabledFor(logging.DEBUG):
+        logging.getLogger("httpx").setLevel(logging.WARNING)
     apply = args.apply
     dry = args.dry_run or not apply
 
@@ -442,24 +1143,17 @@ def main():
 
     if recipe_path:
         # Single recipe
-        print(f"Reading recipe: {os.path.abspath(recipe_path)}")
-        update_single_recipe(recipe_path, owner, repo, headers, token, apply, dry)
+        log.info("Reading recipe: %s", os.path.abspath(recipe_path))
+        asyncio.run(update_recipe(recipe_path, owner, repo, headers, token, apply, dry))
         return
 
     # No recipe specified: update all recipes under recipes/*/recipe.yaml
-    import glob
-
-    pattern = os.path.join("recipes", "*", "recipe.yaml")
-    files = glob.glob(pattern)
+    files = find_recipe_files()
     if not files:
-        print("No recipes found to process")
+        log.info("No recipes found to process")
         return
 
-    for fp in sorted(files):
-        try:
-            update_single_recipe(fp, owner, repo, headers, token, apply, dry)
-        except Exception as e:
-            print(f"Failed to update {fp}: {e}")
+    asyncio.run(update_recipes(files, owner, repo, headers, token, apply, dry))
 
 
 if __name__ == "__main__":